@@ -0,0 +1,115 @@
+"""
+Admission Control
+Token-bucket rate limiting and a bounded concurrency gate for research requests.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+
+class TokenBucket:
+    """Allow `rate` operations per second on average, with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens if available; never blocks"""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+
+class RateLimiter:
+    """
+    One TokenBucket per key, e.g. per client id or per upstream host.
+
+    At most `max_keys` buckets are kept; the least recently used one is
+    dropped to make room, so lookups stay O(1) however many clients appear.
+    """
+
+    def __init__(self, rate: float, capacity: float, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[Hashable, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._buckets)
+
+    def try_acquire(self, key: Hashable, tokens: float = 1) -> bool:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._buckets.popitem(last=False)
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity, self._clock)
+            else:
+                self._buckets.move_to_end(key)
+        return bucket.try_acquire(tokens)
+
+
+class AdmissionController:
+    """
+    Cap concurrent work, queue a bounded number of waiters and shed the rest.
+
+    `acquire` returns False immediately when the wait queue is full, or after
+    `queue_timeout` seconds if no slot frees up; callers should then answer
+    with a cached or "busy" response instead of waiting longer.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> bool:
+        with self._condition:
+            if self._active < self.max_concurrent:
+                self._active += 1
+                return True
+            if self._waiting >= self.max_queue:
+                return False
+            self._waiting += 1
+            try:
+                admitted = self._condition.wait_for(
+                    lambda: self._active < self.max_concurrent, timeout=self.queue_timeout
+                )
+            finally:
+                self._waiting -= 1
+            if admitted:
+                self._active += 1
+            return admitted
+
+    def release(self):
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
@@ -0,0 +1,139 @@
+"""
+Compact Article Storage
+Slotted article records and a per-source cache for parsed news feeds.
+"""
+
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+# Words as stored in Article.description; queries are split the same way
+WORD_RE = re.compile(r"\w+")
+
+
+# Query pieces this short only match a whole description word ("u" must not match "business")
+SHORT_WORD = 2
+
+
+def query_terms(query: str) -> List[Tuple[str, Tuple[str, ...]]]:
+    """
+    Split a query into terms, each as (lowercase term, its words).
+
+    "U.S. covid-19" becomes [("u.s.", ("u", "s")), ("covid-19", ("covid", "19"))]:
+    the raw term is matched against the title as before, the words against the
+    tokenized description.
+    """
+    terms = [(term, tuple(WORD_RE.findall(term))) for term in query.lower().split()]
+    return list(dict.fromkeys(term for term in terms if term[1]))
+
+
+def _word_matches(word: str, token: str) -> bool:
+    return word == token if len(word) <= SHORT_WORD else word in token
+
+
+class Article:
+    """
+    One news article, stored without a per-instance __dict__.
+
+    Source and category names are interned so thousands of cached articles
+    share a single copy of each, the description is kept only as a tuple of
+    its lowercase words in order (interned, so the feed vocabulary is stored
+    once), and the publication time is an integer epoch (0 when the
+    feed gave no date).
+    """
+
+    __slots__ = ("title", "description", "link", "source", "category", "timestamp", "fingerprint")
+
+    def __init__(self, title: str, description: tuple, link: str, source: str, category: str, timestamp: int = 0):
+        self.title = title
+        self.description = tuple(map(sys.intern, description))
+        self.link = link
+        self.source = sys.intern(source)
+        self.category = sys.intern(category)
+        self.timestamp = timestamp
+        # Title SimHash, filled in lazily by dedup.StoryClusterer
+        self.fingerprint = None
+
+    def matches(self, terms: List[Tuple[str, Tuple[str, ...]]]) -> bool:
+        """
+        Check if any query term (from `query_terms`) matches the article.
+
+        A term matches when it is a substring of the title, or when its words
+        appear as consecutive description words. Longer words may match inside
+        a description word, so "vaccine" still finds "vaccines"; words of
+        SHORT_WORD characters or fewer must match a whole word.
+        """
+        title = self.title.lower()
+        return any(term in title or self._has_phrase(words) for term, words in terms)
+
+    def _has_phrase(self, words: Tuple[str, ...]) -> bool:
+        tokens = self.description
+        for start in range(len(tokens) - len(words) + 1):
+            if all(_word_matches(word, tokens[start + offset]) for offset, word in enumerate(words)):
+                return True
+        return False
+
+    def sort_key(self, now: int) -> int:
+        """Undated articles sort as if published now, as they always have"""
+        return self.timestamp or now
+
+    @property
+    def date_str(self) -> str:
+        if not self.timestamp:
+            return 'Date unknown'
+        return datetime.fromtimestamp(self.timestamp, timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+
+    def __repr__(self):
+        return f"Article({self.title!r}, source={self.source!r}, timestamp={self.timestamp})"
+
+
+def to_epoch(date: datetime) -> int:
+    """Convert a parsed feed date to an integer epoch, treating naive dates as UTC"""
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return int(date.timestamp())
+
+
+class ArticleCache:
+    """Parsed articles per source, refreshed once they are older than `ttl` seconds (or a per-call ttl)"""
+
+    def __init__(self, ttl: float = 600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple] = {}
+
+    def get(self, source: str, ttl: Optional[float] = None) -> Optional[List[Article]]:
+        """Return the cached articles for a source, or None if missing or older than `ttl`"""
+        with self._lock:
+            entry = self._entries.get(source)
+        if entry is None:
+            return None
+        fetched_at, articles = entry
+        if time.monotonic() - fetched_at > (self.ttl if ttl is None else ttl):
+            return None
+        return articles
+
+    def peek(self, source: str) -> Optional[List[Article]]:
+        """Return the cached articles for a source even if they are stale"""
+        with self._lock:
+            entry = self._entries.get(source)
+        return entry[1] if entry else None
+
+    def put(self, source: str, articles: List[Article]):
+        with self._lock:
+            self._entries[source] = (time.monotonic(), articles)
+
+    def invalidate(self, source: Optional[str] = None):
+        """Drop one source's articles, or everything when no source is given"""
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(source, None)
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(articles) for _, articles in self._entries.values())
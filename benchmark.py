@@ -0,0 +1,128 @@
+"""
+Benchmarks
+Offline measurements for the news pipeline. Run with `python benchmark.py`.
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from articles import Article
+from feed_parsing import description_tokens, fetch_feeds, get_process_pool
+
+SOURCES = ["Reuters", "BBC", "NPR", "Wired", "Nature", "Forbes", "CDC", "GreenBiz"]
+CATEGORIES = ["General News", "Technology", "Science", "Business", "Health", "Environment"]
+WORDS = ("climate market vaccine launch quantum election energy policy "
+         "study report chip rocket bank storm court trade").split()
+
+
+def synthetic_entries(count: int, seed: int = 0):
+    """Feed-like raw fields, built fresh per entry as a parser would"""
+    rng = random.Random(seed)
+    for i in range(count):
+        title = " ".join(rng.choice(WORDS) for _ in range(8)).title()
+        description = "<p>" + " ".join(rng.choice(WORDS) for _ in range(30)) + "</p>"
+        link = f"https://news.example.com/{i}/{title.replace(' ', '-').lower()}"
+        # Strings coming out of a parser are fresh objects, not shared literals
+        source = "".join(rng.choice(SOURCES))
+        category = "".join(rng.choice(CATEGORIES))
+        yield title, description, link, source, category, 1700000000 + i * 60
+
+
+def build_dicts(entries):
+    return [
+        {
+            'title': title,
+            'date': datetime.fromtimestamp(ts, timezone.utc).strftime('%Y-%m-%d %H:%M UTC'),
+            'source': source,
+            'category': category,
+            'timestamp': datetime.fromtimestamp(ts, timezone.utc),
+            'link': link,
+        }
+        for title, _description, link, source, category, ts in entries
+    ]
+
+
+def build_articles(entries):
+    # Tokenized here, inside the measured region, since every Article keeps its tokens
+    return [
+        Article(title, description_tokens(description), link, source, category, ts)
+        for title, description, link, source, category, ts in entries
+    ]
+
+
+def measure_bytes_per_item(build, count: int) -> float:
+    entries = list(synthetic_entries(count))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build(entries)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def bench_article_memory(count: int = 10000):
+    """Compare per-article memory of the old dict layout and slotted Article"""
+    # Title and link text is held identically by both layouts; everything else is counted,
+    # including the description tokens that only Article keeps
+    print(f"Article memory ({count} articles, excluding title/link text common to both layouts):")
+    dict_bytes = measure_bytes_per_item(build_dicts, count)
+    article_bytes = measure_bytes_per_item(build_articles, count)
+    print(f"  dict layout:     {dict_bytes:8.1f} bytes/article")
+    print(f"  Article (slots): {article_bytes:8.1f} bytes/article")
+    print(f"  saving:          {1 - article_bytes / dict_bytes:8.1%}")
+
+
+def synthetic_feed(items: int, seed: int) -> bytes:
+    """An RSS document shaped like the publisher feeds"""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(items):
+        title = " ".join(rng.choice(WORDS) for _ in range(8)).title()
+        description = " ".join(rng.choice(WORDS) for _ in range(60))
+        entries.append(
+            f"<item><title>{title}</title>"
+            f"<link>https://news.example.com/{seed}/{i}</link>"
+            f"<description>&lt;p&gt;{description}&lt;/p&gt;</description>"
+            f"<pubDate>Mon, 0{i % 9 + 1} Jan 2024 12:00:00 +0000</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>'
+        + "".join(entries) + "</channel></rss>"
+    ).encode()
+
+
+def bench_feed_parsing(feed_counts=(8, 32, 128), items_per_feed: int = 50):
+    """Thread-only versus process-pool parsing throughput, downloads excluded"""
+
+    processes = os.cpu_count() or 1
+    # Start the workers before timing so pool startup is not counted
+    get_process_pool(processes).submit(int).result()
+
+    print(f"Feed parsing ({items_per_feed} items per feed, {processes} worker processes):")
+    print(f"  {'feeds':>5}  {'threads':>14}  {'process pool':>14}")
+    for count in feed_counts:
+        payloads = {f"feed-{i}": synthetic_feed(items_per_feed, i) for i in range(count)}
+        feeds = {name: name for name in payloads}
+        rates = []
+        for parse_processes in (0, processes):
+            start = time.perf_counter()
+            fetch_feeds(feeds, fetch_workers=8, parse_processes=parse_processes, download=lambda url, timeout: payloads[url])
+            rates.append(count / (time.perf_counter() - start))
+        print(f"  {count:>5}  {rates[0]:>8.1f} feed/s  {rates[1]:>8.1f} feed/s")
+
+
+BENCHMARKS = {
+    "memory": bench_article_memory,
+    "parsing": bench_feed_parsing,
+}
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        BENCHMARKS[name]()
+        print()
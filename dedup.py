@@ -0,0 +1,123 @@
+"""
+Near-Duplicate Story Detection
+Clusters copies of the same story from different feeds using SimHash over normalized titles.
+"""
+
+import hashlib
+import re
+from typing import Dict, List
+
+FINGERPRINT_BITS = 64
+# Titles within this many differing bits are treated as the same story; short
+# headlines shift more bits per changed word than full documents do
+MAX_DISTANCE = 7
+# MAX_DISTANCE + 1 bands guarantee near-duplicates share at least one band exactly
+BANDS = MAX_DISTANCE + 1
+_BAND_BITS = FINGERPRINT_BITS // BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or over says "
+    "that the this to was were will with after amid".split()
+)
+# Trailing " - BBC News" / " | Reuters" style publisher suffixes
+_SUFFIX_RE = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_title(title: str) -> List[str]:
+    """Lowercase, drop publisher suffixes, punctuation and stopwords"""
+    title = _SUFFIX_RE.sub("", title).lower()
+    return [token for token in _TOKEN_RE.findall(title) if token not in _STOPWORDS]
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(tokens: List[str]) -> int:
+    """64-bit SimHash over title words and word pairs"""
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    weights = [0] * FINGERPRINT_BITS
+    for feature in features:
+        value = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def title_fingerprint(title: str) -> int:
+    """Fingerprint of a title, or 0 when nothing is left after normalization"""
+    tokens = normalize_title(title)
+    return simhash(tokens) if tokens else 0
+
+
+class StoryCluster:
+    """
+    One story and every source that carried it.
+
+    The category is fixed by the article that started the cluster, and
+    `article` is the newest copy from that category, so the story is always
+    shown under the category it was ranked in.
+    """
+
+    __slots__ = ("article", "category", "sources", "fingerprint")
+
+    def __init__(self, article, fingerprint: int):
+        self.article = article
+        self.category = article.category
+        self.sources = [article.source]
+        self.fingerprint = fingerprint
+
+    def add(self, article, now: int):
+        if article.source not in self.sources:
+            self.sources.append(article.source)
+        if article.category == self.category and article.sort_key(now) > self.article.sort_key(now):
+            self.article = article
+
+    def sort_key(self, now: int) -> int:
+        return self.article.sort_key(now)
+
+
+class StoryClusterer:
+    """
+    Incrementally groups articles into StoryClusters as they are added.
+
+    Fingerprints are bucketed by band so each new article is only compared
+    against clusters that share at least one band with it.
+    """
+
+    def __init__(self, now: int):
+        self.now = now
+        self.clusters: List[StoryCluster] = []
+        self._buckets: Dict[tuple, List[StoryCluster]] = {}
+
+    def add(self, article) -> tuple:
+        """
+        Add an article to its cluster.
+
+        Returns:
+            tuple: (cluster, is_new) where is_new is True if the article started a new cluster
+        """
+        if article.fingerprint is None:
+            article.fingerprint = title_fingerprint(article.title)
+        fingerprint = article.fingerprint
+
+        keys = [(band, fingerprint >> (band * _BAND_BITS) & _BAND_MASK) for band in range(BANDS)]
+        if fingerprint:
+            for key in keys:
+                for cluster in self._buckets.get(key, ()):
+                    if bin(cluster.fingerprint ^ fingerprint).count("1") <= MAX_DISTANCE:
+                        cluster.add(article, self.now)
+                        return cluster, False
+
+        cluster = StoryCluster(article, fingerprint)
+        self.clusters.append(cluster)
+        if fingerprint:
+            for key in keys:
+                self._buckets.setdefault(key, []).append(cluster)
+        return cluster, True
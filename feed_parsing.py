@@ -0,0 +1,171 @@
+"""
+Feed Parsing
+Concurrent feed downloads with optional process-pool parsing into compact article records.
+"""
+
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import feedparser
+import requests
+
+from articles import WORD_RE, to_epoch
+
+# (title, description tokens, epoch timestamp, link) - cheap to pickle back to the parent
+ArticleRecord = Tuple[str, Tuple[str, ...], int, str]
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def parse_date(date_str: str) -> datetime:
+    """Parse various date formats to datetime object"""
+    try:
+        # Try parsing common RSS date formats
+        for fmt in ['%a, %d %b %Y %H:%M:%S %z', '%Y-%m-%dT%H:%M:%S%z']:
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+
+        # If standard formats fail, use feedparser's date parser
+        parsed = feedparser._parse_date(date_str)
+        if parsed:
+            return datetime(*parsed[:6])
+
+        # Last resort: current time
+        return datetime.now(timezone.utc)
+    except Exception:
+        return datetime.now(timezone.utc)
+
+
+def description_tokens(description: str) -> Tuple[str, ...]:
+    """Lowercase words of a description in order, with HTML markup removed"""
+    return tuple(WORD_RE.findall(_TAG_RE.sub(" ", description).lower()))
+
+
+def parse_feed(raw: bytes) -> List[ArticleRecord]:
+    """Parse raw feed bytes into normalized article records; safe to run in a worker process"""
+    feed = feedparser.parse(raw)
+    records = []
+    for entry in feed.entries:
+        # Get publication date
+        pub_date = entry.get('published', entry.get('updated', ''))
+        records.append((
+            entry.get('title', 'No title'),
+            description_tokens(entry.get('description', '')),
+            to_epoch(parse_date(pub_date)) if pub_date else 0,
+            entry.get('link', ''),
+        ))
+    return records
+
+
+def download_feed(url: str, timeout: float = 10) -> bytes:
+    """Fetch the raw bytes of a feed"""
+    response = requests.get(url, timeout=timeout, headers={"User-Agent": "research-assistant/1.0"})
+    response.raise_for_status()
+    return response.content
+
+
+_process_pool = None
+_process_pool_size = 0
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool(processes: int) -> ProcessPoolExecutor:
+    """
+    Return the shared parsing pool, starting it on first use.
+
+    A request for a different number of processes replaces the pool.
+    Workers are started lazily from the download threads, so they must not be
+    forked from this multi-threaded process: a fork could copy a lock held by
+    another thread (urllib3, SSL) and deadlock the child.
+    """
+    global _process_pool, _process_pool_size
+    with _process_pool_lock:
+        if _process_pool is not None and _process_pool_size != processes:
+            _process_pool.shutdown(wait=False)
+            _process_pool = None
+        if _process_pool is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _process_pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context(method)
+            )
+            _process_pool_size = processes
+        return _process_pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next `get_process_pool` call starts a fresh one"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def fetch_feeds(
+    feeds: Dict[str, str],
+    fetch_workers: int = 8,
+    parse_processes: int = 0,
+    timeout: float = 10,
+    download: Optional[Callable[[str, float], bytes]] = None,
+    timeouts: Optional[Dict[str, float]] = None,
+) -> Dict[str, object]:
+    """
+    Download feeds concurrently and parse them into article records.
+
+    If a parsing worker dies, the broken pool is discarded and the affected
+    feeds are parsed in threads instead; the next call starts a new pool.
+
+    Args:
+        feeds (dict): Source name to feed URL
+        fetch_workers (int): Threads used for downloads (and for parsing in thread-only mode)
+        parse_processes (int): Worker processes for parsing; 0 parses in the download threads
+        timeout (float): Per-request timeout in seconds
+        download (callable): Replacement for `download_feed`, taking a URL and a timeout
+        timeouts (dict): Per-source timeouts overriding `timeout`
+
+    Returns:
+        dict: Source name to a list of records, or to the exception that source raised
+    """
+    if not feeds:
+        return {}
+    download = download or download_feed
+    timeouts = timeouts or {}
+    pool = get_process_pool(parse_processes) if parse_processes > 0 else None
+
+    def work(url, source_timeout):
+        raw = download(url, source_timeout)
+        if pool is None:
+            return parse_feed(raw)
+        try:
+            return raw, pool.submit(parse_feed, raw)
+        except BrokenProcessPool:
+            discard_process_pool(pool)
+            return parse_feed(raw)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(fetch_workers, len(feeds))) as threads:
+        futures = {
+            source: threads.submit(work, url, timeouts.get(source, timeout))
+            for source, url in feeds.items()
+        }
+        for source, future in futures.items():
+            try:
+                outcome = future.result()
+                if isinstance(outcome, tuple):
+                    raw, parsing = outcome
+                    try:
+                        outcome = parsing.result()
+                    except BrokenProcessPool:
+                        discard_process_pool(pool)
+                        outcome = parse_feed(raw)
+                results[source] = outcome
+            except Exception as e:
+                results[source] = e
+    return results
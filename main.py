@@ -4,9 +4,14 @@ from pydantic import BaseModel
 from langchain_community.tools import WikipediaQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
 from typing import List, Optional
-import feedparser
-from datetime import datetime, timezone
 import time
+from urllib.parse import urlparse
+from admission import AdmissionController, RateLimiter
+from research_store import get_store
+from articles import Article, ArticleCache, query_terms
+from source_catalog import SourceCatalog
+from feed_parsing import fetch_feeds
+from dedup import StoryClusterer
 
 # Load environment variables from .env
 load_dotenv()
@@ -26,47 +31,71 @@ wikipedia = WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper(
     doc_content_chars_max=2000
 ))
 
-# Define major news sources RSS feeds with categories
-NEWS_SOURCES = {
-    # General News
-    "Reuters": "https://www.reutersagency.com/feed/",
-    "Associated Press": "https://feeds.feedburner.com/apnews/world",
-    "NPR": "https://feeds.npr.org/1001/rss.xml",
-    "BBC": "http://feeds.bbci.co.uk/news/world/rss.xml",
-    "The Guardian": "https://www.theguardian.com/world/rss",
-    
-    # Technology
-    "TechCrunch": "https://feeds.feedburner.com/TechCrunch",
-    "Wired": "https://www.wired.com/feed/rss",
-    "The Verge": "https://www.theverge.com/rss/index.xml",
-    "Ars Technica": "http://feeds.arstechnica.com/arstechnica/index",
-    
-    # Science
-    "Scientific American": "http://rss.sciam.com/ScientificAmerican-Global",
-    "Science Daily": "https://www.sciencedaily.com/rss/all.xml",
-    "Nature": "http://feeds.nature.com/nature/rss/current",
-    "Space.com": "https://www.space.com/feeds/all",
-    
-    # Business & Finance
-    "Forbes": "https://www.forbes.com/business/feed/",
-    "Financial Times": "https://www.ft.com/rss/home",
-    "Bloomberg": "https://feeds.bloomberg.com/markets/news.rss",
-    
-    # Health & Medicine
-    "Medical News Today": "https://rss.medicalnewstoday.com/all-news.xml",
-    "WHO News": "https://www.who.int/rss-feeds/news-english.xml",
-    "CDC": "https://tools.cdc.gov/api/v2/resources/media/403372.rss",
-    
-    # Environment
-    "Environmental News Network": "https://www.enn.com/rss",
-    "GreenBiz": "https://www.greenbiz.com/rss.xml",
-    "CleanTechnica": "https://cleantechnica.com/feed/"
-}
+# News feeds, their categories and polling settings live in news_sources.json
+# (or NEWS_SOURCES_FILE) and are reloaded whenever the file changes
+source_catalog = SourceCatalog()
+source_catalog.reload_if_changed()
+
+# Parsed feed articles, reused across queries until the source's refresh interval passes
+article_cache = ArticleCache()
+
+# Feeds download in threads; set FEED_PARSE_PROCESSES to move XML parsing off the GIL
+FEED_FETCH_WORKERS = int(os.getenv("FEED_FETCH_WORKERS", "8"))
+FEED_PARSE_PROCESSES = int(os.getenv("FEED_PARSE_PROCESSES", "0"))
 
-def research_topic(query: str) -> ResearchResponse:
-    """Research a topic using Wikipedia and news sources"""
+# Admission control: per-client and per-upstream-host token buckets, plus a
+# global cap on concurrent research with a short, bounded wait queue
+CLIENT_RATE = float(os.getenv("RESEARCH_CLIENT_RATE", "0.2"))
+CLIENT_BURST = float(os.getenv("RESEARCH_CLIENT_BURST", "5"))
+UPSTREAM_RATE = float(os.getenv("UPSTREAM_HOST_RATE", "1"))
+UPSTREAM_BURST = float(os.getenv("UPSTREAM_HOST_BURST", "5"))
+client_limiter = RateLimiter(CLIENT_RATE, CLIENT_BURST)
+upstream_limiter = RateLimiter(UPSTREAM_RATE, UPSTREAM_BURST)
+admission = AdmissionController(
+    max_concurrent=int(os.getenv("RESEARCH_MAX_CONCURRENT", "4")),
+    max_queue=int(os.getenv("RESEARCH_MAX_QUEUE", "8")),
+    queue_timeout=float(os.getenv("RESEARCH_QUEUE_TIMEOUT", "2"))
+)
+WIKIPEDIA_HOST = "en.wikipedia.org"
+
+def busy_response(query: str) -> ResearchResponse:
+    """Answer a shed request from the research store, or with a quick "busy" message"""
+    try:
+        cached = get_store().latest(query)
+        if cached:
+            response = ResearchResponse.model_validate(cached)
+            response.tools_used = response.tools_used + ["Research Cache"]
+            return response
+    except Exception as e:
+        # A missing or unusable stored result just means answering "busy"
+        print(f"Error reading cached research result: {str(e)}")
+    return ResearchResponse(
+        topic=query,
+        summary="The research service is busy right now. Please try again in a moment.",
+        sources=[],
+        tools_used=[],
+        recent_news=[]
+    )
+
+def research_topic(query: str, client_id: str = "local") -> ResearchResponse:
+    """Research a topic using Wikipedia and news sources, subject to admission control"""
+    if not client_limiter.try_acquire(client_id):
+        print(f"Rate limit reached for client {client_id}")
+        return busy_response(query)
+    if not admission.acquire():
+        print("Research capacity saturated, shedding request")
+        return busy_response(query)
     try:
-        # Get Wikipedia summary
+        return _research_topic(query)
+    finally:
+        admission.release()
+
+def _research_topic(query: str) -> ResearchResponse:
+    try:
+        # Get Wikipedia summary, unless we are already at our request budget for it
+        if not upstream_limiter.try_acquire(WIKIPEDIA_HOST):
+            print(f"Rate limit reached for {WIKIPEDIA_HOST}")
+            return busy_response(query)
         wiki_result = wikipedia.run(query)
         
         # Get recent news
@@ -85,6 +114,12 @@ def research_topic(query: str) -> ResearchResponse:
             recent_news=news_results
         )
         
+        # Keep the result so later runs can reuse it
+        try:
+            get_store().save(response)
+        except Exception as e:
+            print(f"Error saving research result: {str(e)}")
+        
         return response
     except Exception as e:
         print(f"Error in research_topic: {str(e)}")
@@ -97,96 +132,76 @@ def research_topic(query: str) -> ResearchResponse:
             recent_news=[]
         )
 
-def parse_date(date_str: str) -> datetime:
-    """Parse various date formats to datetime object"""
-    try:
-        # Try parsing common RSS date formats
-        for fmt in ['%a, %d %b %Y %H:%M:%S %z', '%Y-%m-%dT%H:%M:%S%z']:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        
-        # If standard formats fail, use feedparser's date parser
-        parsed = feedparser._parse_date(date_str)
-        if parsed:
-            return datetime(*parsed[:6])
-        
-        # Last resort: current time
-        return datetime.now(timezone.utc)
-    except Exception:
-        return datetime.now(timezone.utc)
+def load_source_articles() -> dict:
+    """
+    Return articles for every news source, refreshing stale sources concurrently.
+    
+    A source that is throttled or fails to refresh keeps serving the articles
+    it last fetched successfully.
+    """
+    # Pick up catalog edits; only sources that changed lose their cached articles
+    for source in source_catalog.reload_if_changed():
+        article_cache.invalidate(source)
+    catalog = source_catalog.sources
+    
+    sources = {}
+    stale = {}
+    for source, feed in catalog.items():
+        articles = article_cache.get(source, ttl=feed.refresh_interval)
+        if articles is None:
+            if upstream_limiter.try_acquire(urlparse(feed.url).netloc):
+                stale[source] = feed.url
+            else:
+                # Host is over budget: keep serving whatever we fetched last
+                articles = article_cache.peek(source) or []
+        sources[source] = articles
+    
+    # The workers return plain records; building and caching Articles is all that happens here
+    timeouts = {source: catalog[source].timeout for source in stale}
+    for source, records in fetch_feeds(stale, FEED_FETCH_WORKERS, FEED_PARSE_PROCESSES, timeouts=timeouts).items():
+        if isinstance(records, Exception):
+            print(f"Error fetching from {source}: {str(records)}")
+            sources[source] = article_cache.peek(source) or []
+            continue
+        category = catalog[source].category
+        articles = [Article(title, description, link, source, category, timestamp)
+                    for title, description, timestamp, link in records]
+        article_cache.put(source, articles)
+        sources[source] = articles
+    return sources
 
 def get_recent_news(query: str, max_results: int = 3) -> List[str]:
     """Get recent news articles using RSS feeds from multiple sources"""
     try:
         print("Fetching news from RSS feeds...")
         all_articles = []
-        query_terms = set(query.lower().split())
+        terms = query_terms(query)
+        now = int(time.time())
+        # Copies of one wire story across feeds collapse into a single cluster
+        clusterer = StoryClusterer(now)
         
         # Track which categories have matched articles
-        category_matches = {
-            "General News": [],
-            "Technology": [],
-            "Science": [],
-            "Business": [],
-            "Health": [],
-            "Environment": []
-        }
+        category_matches = {category: [] for category in source_catalog.categories}
         
-        for source, feed_url in NEWS_SOURCES.items():
+        for source, articles in load_source_articles().items():
             try:
-                # Parse the RSS feed
-                feed = feedparser.parse(feed_url)
-                
-                # Determine category based on source
-                category = "General News"
-                if source in ["TechCrunch", "Wired", "The Verge", "Ars Technica"]:
-                    category = "Technology"
-                elif source in ["Scientific American", "Science Daily", "Nature", "Space.com"]:
-                    category = "Science"
-                elif source in ["Forbes", "Financial Times", "Bloomberg"]:
-                    category = "Business"
-                elif source in ["Medical News Today", "WHO News", "CDC"]:
-                    category = "Health"
-                elif source in ["Environmental News Network", "GreenBiz", "CleanTechnica"]:
-                    category = "Environment"
-                
-                # Process each entry in the feed
-                for entry in feed.entries:
+                for article in articles:
                     # Check if article matches query
-                    title = entry.get('title', '').lower()
-                    description = entry.get('description', '').lower()
-                    
-                    # Check if any query term is in title or description
-                    if any(term in title or term in description for term in query_terms):
-                        # Get publication date
-                        pub_date = entry.get('published', entry.get('updated', ''))
-                        if pub_date:
-                            date = parse_date(pub_date)
-                            date_str = date.strftime('%Y-%m-%d %H:%M UTC')
-                        else:
-                            date_str = 'Date unknown'
-                        
-                        article = {
-                            'title': entry.get('title', 'No title'),
-                            'date': date_str,
-                            'source': source,
-                            'category': category,
-                            'timestamp': date if pub_date else datetime.now(timezone.utc),
-                            'link': entry.get('link', '')
-                        }
-                        
-                        # Add to both overall list and category-specific list
-                        all_articles.append(article)
-                        category_matches[category].append(article)
+                    if article.matches(terms):
+                        cluster, is_new = clusterer.add(article)
+                        if is_new:
+                            # Add to both overall list and category-specific list
+                            all_articles.append(cluster)
+                            category_matches.setdefault(cluster.category, []).append(cluster)
                 
             except Exception as e:
                 print(f"Error fetching from {source}: {str(e)}")
                 continue
         
-        # Sort articles by date (newest first)
-        all_articles.sort(key=lambda x: x['timestamp'], reverse=True)
+        # Sort articles by date (newest first); source priority breaks ties
+        priorities = {name: feed.priority for name, feed in source_catalog.sources.items()}
+        rank = lambda x: (x.sort_key(now), priorities.get(x.article.source, 0))
+        all_articles.sort(key=rank, reverse=True)
         
         # Try to get articles from different categories if possible
         selected_articles = []
@@ -196,7 +211,7 @@ def get_recent_news(query: str, max_results: int = 3) -> List[str]:
             # First, take one article from each category that has matches
             for category in categories_with_matches:
                 if len(selected_articles) < max_results:
-                    category_matches[category].sort(key=lambda x: x['timestamp'], reverse=True)
+                    category_matches[category].sort(key=rank, reverse=True)
                     selected_articles.append(category_matches[category][0])
             
             # If we still need more articles, take the newest remaining ones
@@ -213,9 +228,9 @@ def get_recent_news(query: str, max_results: int = 3) -> List[str]:
             # Fallback to DuckDuckGo
             return get_news_from_duckduckgo(query, max_results)
         
-        # Format the results with category
-        return [f"{article['title']} ({article['category']}: {article['source']}, {article['date']})" 
-                for article in selected_articles]
+        # Format the results with category and every source that carried the story
+        return [f"{cluster.article.title} ({cluster.category}: {', '.join(cluster.sources)}, {cluster.article.date_str})" 
+                for cluster in selected_articles]
             
     except Exception as e:
         print(f"Error fetching news from RSS feeds: {str(e)}")
@@ -0,0 +1,194 @@
+"""
+Research Result Store
+Append-only SQLite store for past research responses, indexed by topic and time.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+DEFAULT_STORE_PATH = os.getenv("RESEARCH_STORE_PATH", "research_store.db")
+# Opt-in retention: every COMPACT_EVERY appended rows (0 = never), keep only
+# KEEP_PER_TOPIC results per topic
+DEFAULT_KEEP_PER_TOPIC = int(os.getenv("RESEARCH_STORE_KEEP_PER_TOPIC", "5"))
+DEFAULT_COMPACT_EVERY = int(os.getenv("RESEARCH_STORE_COMPACT_EVERY", "0"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS research_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic_key TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_topic_time ON research_results (topic_key, saved_at);
+CREATE INDEX IF NOT EXISTS idx_results_time ON research_results (saved_at);
+"""
+
+
+def topic_key(topic: str) -> str:
+    """Normalize a topic so 'AI ', 'ai' and 'Ai' share one index key"""
+    return " ".join(topic.lower().split())
+
+
+def _to_payload(response) -> dict:
+    """Accept a ResearchResponse (or any pydantic model) or a plain dict"""
+    if hasattr(response, "model_dump"):
+        return response.model_dump()
+    return dict(response)
+
+
+class ResearchStore:
+    """
+    Persist research responses keyed by topic and save time.
+
+    Rows are only ever appended; `compact` is the one operation that removes
+    data, trimming old results per topic. It only runs automatically when
+    `compact_every` is set; `vacuum` rewrites the file and is left to explicit
+    maintenance because it blocks every reader while it runs.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_STORE_PATH,
+        keep_per_topic: int = DEFAULT_KEEP_PER_TOPIC,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
+        self.path = path
+        self.keep_per_topic = keep_per_topic
+        self.compact_every = compact_every
+        self._appended = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # Lets compact() hand freed pages back cheaply; only takes effect on new files
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def save(self, response, saved_at: Optional[float] = None) -> int:
+        """Append one response and return its row id"""
+        payload = _to_payload(response)
+        saved_at = time.time() if saved_at is None else saved_at
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO research_results (topic_key, topic, saved_at, payload) VALUES (?, ?, ?, ?)",
+                (topic_key(payload["topic"]), payload["topic"], saved_at, json.dumps(payload)),
+            )
+        self._after_append(1)
+        return cursor.lastrowid
+
+    def save_many(self, responses: Iterable, saved_at: Optional[float] = None) -> int:
+        """Append many responses in a single transaction and return how many were written"""
+        saved_at = time.time() if saved_at is None else saved_at
+        rows = []
+        for response in responses:
+            payload = _to_payload(response)
+            rows.append((topic_key(payload["topic"]), payload["topic"], saved_at, json.dumps(payload)))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO research_results (topic_key, topic, saved_at, payload) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        self._after_append(len(rows))
+        return len(rows)
+
+    def _after_append(self, count: int):
+        """Run the retention compaction once enough rows have been appended"""
+        if not self.compact_every:
+            return
+        with self._lock:
+            self._appended += count
+            due = self._appended >= self.compact_every
+            if due:
+                self._appended = 0
+        if due:
+            self.compact(self.keep_per_topic)
+
+    def latest(self, topic: str) -> Optional[dict]:
+        """Return the most recently saved result for a topic, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT saved_at, payload FROM research_results WHERE topic_key = ? "
+                "ORDER BY saved_at DESC, id DESC LIMIT 1",
+                (topic_key(topic),),
+            ).fetchone()
+        return self._decode(row) if row else None
+
+    def between(self, start: float, end: float, topic: Optional[str] = None, limit: Optional[int] = None) -> List[dict]:
+        """Return results saved in [start, end), newest first, optionally for one topic"""
+        sql = "SELECT saved_at, payload FROM research_results WHERE saved_at >= ? AND saved_at < ?"
+        params = [start, end]
+        if topic is not None:
+            sql += " AND topic_key = ?"
+            params.append(topic_key(topic))
+        sql += " ORDER BY saved_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._decode(row) for row in rows]
+
+    def compact(self, keep_per_topic: int = DEFAULT_KEEP_PER_TOPIC, older_than: Optional[float] = None) -> int:
+        """
+        Drop all but the newest `keep_per_topic` results of each topic.
+
+        Args:
+            keep_per_topic (int): Number of newest results to keep for every topic
+            older_than (float): If set, only rows saved before this epoch are eligible
+
+        Returns:
+            int: Number of rows removed
+        """
+        sql = (
+            "DELETE FROM research_results WHERE id IN ("
+            " SELECT id FROM ("
+            "  SELECT id, saved_at, ROW_NUMBER() OVER ("
+            "   PARTITION BY topic_key ORDER BY saved_at DESC, id DESC) AS rank"
+            "  FROM research_results)"
+            " WHERE rank > ?"
+        )
+        params = [keep_per_topic]
+        if older_than is not None:
+            sql += " AND saved_at < ?"
+            params.append(older_than)
+        sql += ")"
+        with self._lock:
+            with self._conn:
+                removed = self._conn.execute(sql, params).rowcount
+            self._conn.execute("PRAGMA incremental_vacuum")
+        return removed
+
+    def vacuum(self):
+        """Rewrite the database file to reclaim all free space; run from maintenance, not requests"""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _decode(row) -> dict:
+        saved_at, payload = row
+        result = json.loads(payload)
+        result["saved_at"] = saved_at
+        return result
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_store() -> ResearchStore:
+    """Return the process-wide store, opening it on first use"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ResearchStore()
+        return _default_store
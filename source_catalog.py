@@ -0,0 +1,111 @@
+"""
+News Source Catalog
+Loads the feed catalog from a JSON file and reloads it when the file changes.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Set
+
+from pydantic import BaseModel
+
+DEFAULT_CATALOG_PATH = os.getenv(
+    "NEWS_SOURCES_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "news_sources.json")
+)
+
+
+# Fields baked into a source's cached articles; editing anything else needs no refetch
+CONTENT_FIELDS = ("url", "category")
+
+
+class FeedSource(BaseModel):
+    name: str
+    url: str
+    category: str = "General News"
+    # Seconds before cached articles from this feed are refetched
+    refresh_interval: float = 600
+    # Seconds to wait for the feed to download
+    timeout: float = 10
+    # Higher priority feeds are fetched first and win ranking ties between equally recent stories
+    priority: int = 0
+
+
+def load_catalog(path: str) -> List[FeedSource]:
+    """Read and validate a catalog file of the form {"sources": [{...}, ...]}"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    sources = [FeedSource(**entry) for entry in data["sources"]]
+    names = [source.name for source in sources]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate source names: {', '.join(duplicates)}")
+    return sources
+
+
+class SourceCatalog:
+    """
+    The current set of news feeds, hot-reloaded from `path`.
+
+    `reload_if_changed` is cheap enough to call on every request: it only
+    stats the file unless the modification time or size has moved.
+    """
+
+    def __init__(self, path: str = DEFAULT_CATALOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature = None
+        self._sources: Dict[str, FeedSource] = {}
+        self._categories: List[str] = []
+
+    def reload_if_changed(self) -> Set[str]:
+        """
+        Reload the catalog if its file changed.
+
+        Returns:
+            set: Names of sources that were added, removed or had a CONTENT_FIELDS change
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+                signature = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature = "missing"
+            if signature == self._signature:
+                return set()
+            # Record the signature even if loading fails, so a bad edit is reported once
+            self._signature = signature
+            try:
+                entries = load_catalog(self.path)
+            except Exception as e:
+                # Keep serving the last good catalog
+                print(f"Error loading news source catalog {self.path}: {str(e)}")
+                return set()
+
+            # Stable sort keeps file order among equal priorities
+            sources = {entry.name: entry for entry in sorted(entries, key=lambda entry: entry.priority, reverse=True)}
+            old = self._sources
+            changed = {
+                name for name in old.keys() | sources.keys()
+                if _content(old.get(name)) != _content(sources.get(name))
+            }
+            self._sources = sources
+            # Categories in the order the file first mentions them
+            self._categories = list(dict.fromkeys(entry.category for entry in entries))
+            return changed
+
+    @property
+    def sources(self) -> Dict[str, FeedSource]:
+        """Sources by name, highest priority first"""
+        with self._lock:
+            return self._sources
+
+    @property
+    def categories(self) -> List[str]:
+        with self._lock:
+            return self._categories
+
+
+def _content(source: Optional[FeedSource]) -> Optional[tuple]:
+    return None if source is None else tuple(getattr(source, field) for field in CONTENT_FIELDS)
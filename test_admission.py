@@ -0,0 +1,125 @@
+"""
+Tests for rate limiting, admission control and shed responses
+"""
+import threading
+import time
+
+import pytest
+
+from admission import AdmissionController, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_burst_and_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    clock.now = 0.5  # one token back at 2 tokens/second
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    clock.now = 100  # refill never exceeds capacity
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_rate_limiter_keeps_keys_separate():
+    limiter = RateLimiter(rate=1, capacity=1, clock=FakeClock())
+    assert limiter.try_acquire("a")
+    assert not limiter.try_acquire("a")
+    assert limiter.try_acquire("b")
+
+
+def test_rate_limiter_evicts_least_recently_used_bucket():
+    limiter = RateLimiter(rate=1, capacity=1, max_keys=2, clock=FakeClock())
+    limiter.try_acquire("old")
+    limiter.try_acquire("recent")
+    assert not limiter.try_acquire("old")  # touching "old" makes "recent" the eviction candidate
+
+    limiter.try_acquire("new")
+    assert len(limiter) == 2
+    # "old" kept its empty bucket; "recent" was dropped and starts over full
+    assert not limiter.try_acquire("old")
+    assert limiter.try_acquire("recent")
+    assert len(limiter) == 2
+
+
+def test_admission_sheds_immediately_when_queue_is_full():
+    controller = AdmissionController(max_concurrent=1, max_queue=0, queue_timeout=60)
+    assert controller.acquire()
+    start = time.monotonic()
+    assert not controller.acquire()
+    assert time.monotonic() - start < 1
+
+
+def wait_for_waiters(controller, count):
+    deadline = time.monotonic() + 5
+    while controller.waiting < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_admission_waiter_times_out():
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=0.05)
+    assert controller.acquire()
+    assert not controller.acquire()
+    assert controller.waiting == 0
+    assert controller.active == 1
+
+
+def test_release_wakes_a_waiter():
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=60)
+    assert controller.acquire()
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(controller.acquire()))
+    waiter.start()
+    wait_for_waiters(controller, 1)
+
+    controller.release()
+    waiter.join(timeout=5)
+    assert results == [True]
+    assert controller.active == 1
+
+
+@pytest.fixture
+def research(tmp_path, monkeypatch):
+    main = pytest.importorskip("main")
+    from research_store import ResearchStore
+
+    store = ResearchStore(str(tmp_path / "results.db"), compact_every=0)
+    monkeypatch.setattr(main, "get_store", lambda: store)
+    # A limiter with no capacity refuses every client
+    monkeypatch.setattr(main, "client_limiter", RateLimiter(rate=0, capacity=0))
+    yield main, store
+    store.close()
+
+
+def test_throttled_client_gets_cached_response(research):
+    main, store = research
+    store.save({"topic": "Mars", "summary": "cached", "sources": ["Wikipedia"], "tools_used": ["Wikipedia Search"]})
+    response = main.research_topic("mars", client_id="c")
+    assert response.summary == "cached"
+    assert response.tools_used == ["Wikipedia Search", "Research Cache"]
+
+
+def test_throttled_client_gets_busy_for_partial_stored_row(research):
+    main, store = research
+    store.save({"topic": "busy", "summary": "note"})
+    response = main.research_topic("busy", client_id="c")
+    assert "busy" in response.summary
+    assert response.sources == []
+
+
+def test_saturated_gate_sheds_to_busy(research, monkeypatch):
+    main, _ = research
+    monkeypatch.setattr(main, "client_limiter", RateLimiter(rate=1, capacity=1))
+    monkeypatch.setattr(main, "admission", AdmissionController(max_concurrent=0, max_queue=0, queue_timeout=0))
+    response = main.research_topic("anything", client_id="c")
+    assert "busy" in response.summary
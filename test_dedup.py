@@ -0,0 +1,59 @@
+"""
+Tests for near-duplicate story clustering
+"""
+from articles import Article
+from dedup import StoryClusterer, normalize_title, simhash, title_fingerprint
+
+
+def make_article(title, source="Reuters", category="General News", timestamp=100):
+    return Article(title, (), "", source, category, timestamp)
+
+
+def test_normalize_title_drops_suffix_punctuation_and_stopwords():
+    assert normalize_title("Earthquake strikes Japan, tsunami warning issued - BBC News") == [
+        "earthquake", "strikes", "japan", "tsunami", "warning", "issued"
+    ]
+
+
+def test_simhash_is_deterministic():
+    tokens = normalize_title("SpaceX launches Starship on fourth test flight")
+    assert simhash(tokens) == simhash(list(tokens))
+    assert title_fingerprint("") == 0
+
+
+def test_duplicate_with_publisher_suffix_merges():
+    clusterer = StoryClusterer(now=1000)
+    first, is_new = clusterer.add(make_article("SpaceX launches Starship on fourth test flight", "Reuters"))
+    second, second_is_new = clusterer.add(
+        make_article("SpaceX launches Starship on its fourth test flight - Space.com", "Space.com")
+    )
+    assert is_new and not second_is_new
+    assert second is first
+    assert first.sources == ["Reuters", "Space.com"]
+
+
+def test_different_stories_stay_apart():
+    clusterer = StoryClusterer(now=1000)
+    clusterer.add(make_article("Fed raises interest rates by a quarter point"))
+    _, is_new = clusterer.add(make_article("Fed cuts interest rates by half a point"))
+    assert is_new
+    assert len(clusterer.clusters) == 2
+
+
+def test_empty_titles_never_merge():
+    clusterer = StoryClusterer(now=1000)
+    clusterer.add(make_article("The"))
+    _, is_new = clusterer.add(make_article("!!!", source="BBC"))
+    assert is_new
+    assert len(clusterer.clusters) == 2
+
+
+def test_cluster_keeps_its_category():
+    clusterer = StoryClusterer(now=1000)
+    cluster, _ = clusterer.add(make_article("Apple unveils new iPhone", "Reuters", "General News", 100))
+    clusterer.add(make_article("Apple unveils new iPhone", "Wired", "Technology", 300))
+    clusterer.add(make_article("Apple unveils new iPhone", "BBC", "General News", 200))
+    # The newest copy is from another category, so the newest same-category copy represents it
+    assert cluster.category == "General News"
+    assert cluster.article.source == "BBC"
+    assert cluster.sources == ["Reuters", "Wired", "BBC"]
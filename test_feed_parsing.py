@@ -0,0 +1,126 @@
+"""
+Tests for feed parsing and article matching
+"""
+import os
+
+import pytest
+
+from articles import Article, query_terms
+from feed_parsing import description_tokens, fetch_feeds, get_process_pool, parse_feed
+
+FEED = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>
+<item><title>Health officials update guidance</title><link>https://example.com/1</link>
+<description>&lt;p&gt;New COVID-19 vaccines approved for autumn&lt;/p&gt;</description>
+<pubDate>Mon, 01 Jan 2024 12:00:00 +0000</pubDate></item>
+</channel></rss>"""
+
+
+def make_article(description):
+    return Article("Health officials update guidance", description_tokens(description), "", "CDC", "Health")
+
+
+def test_description_tokens_strip_markup_and_keep_order():
+    assert description_tokens("<p>Vaccines, vaccines and <b>COVID-19</b></p>") == (
+        "vaccines", "vaccines", "and", "covid", "19"
+    )
+
+
+def test_query_terms_split_like_descriptions():
+    assert query_terms("COVID-19 vaccine covid-19 ++") == [("covid-19", ("covid", "19")), ("vaccine", ("vaccine",))]
+
+
+def test_punctuated_query_matches_description():
+    article = make_article("New COVID-19 vaccines approved")
+    assert article.matches(query_terms("covid-19"))
+    assert not article.matches(query_terms("covid-20"))
+
+
+def test_multi_word_term_needs_consecutive_words():
+    assert not make_article("19 people tested for covid").matches(query_terms("covid-19"))
+
+
+def test_short_pieces_need_whole_words():
+    unrelated = Article("Local bakery wins award", description_tokens("A small business in Paris celebrates"), "", "BBC", "General News")
+    assert not unrelated.matches(query_terms("U.S."))
+    assert not unrelated.matches(query_terms("C++"))
+    assert make_article("The U.S. economy grew").matches(query_terms("U.S."))
+    assert make_article("Why C++ still matters").matches(query_terms("C++"))
+
+
+def test_title_matches_raw_term():
+    article = Article("U.S. economy grows", (), "", "NPR", "Business")
+    assert article.matches(query_terms("u.s."))
+    assert not article.matches(query_terms("c++"))
+
+
+def test_singular_query_matches_plural_description():
+    assert make_article("New vaccines approved").matches(query_terms("vaccine"))
+
+
+def test_title_matches_by_substring():
+    assert make_article("").matches(query_terms("official"))
+
+
+def test_parse_feed_returns_compact_records():
+    assert parse_feed(FEED) == [(
+        "Health officials update guidance",
+        ("new", "covid", "19", "vaccines", "approved", "for", "autumn"),
+        1704110400,
+        "https://example.com/1",
+    )]
+
+
+def test_fetch_feeds_in_process_pool_matches_threads():
+    feeds = {"a": "url-a", "b": "url-b"}
+
+    def download(url, timeout):
+        if url == "url-b":
+            raise IOError("unreachable")
+        return FEED
+
+    threaded = fetch_feeds(feeds, parse_processes=0, download=download)
+    pooled = fetch_feeds(feeds, parse_processes=1, download=download)
+    assert threaded["a"] == pooled["a"] == parse_feed(FEED)
+    assert isinstance(pooled["b"], IOError)
+
+
+def test_fetch_feeds_recovers_from_a_broken_pool():
+    broken = get_process_pool(1)
+    # Kill the only worker; the pool reports BrokenProcessPool from then on
+    try:
+        broken.submit(os._exit, 1).result()
+    except Exception:
+        pass
+
+    download = lambda url, timeout: FEED
+    assert fetch_feeds({"a": "url-a"}, parse_processes=1, download=download)["a"] == parse_feed(FEED)
+    fresh = get_process_pool(1)
+    assert fresh is not broken
+    assert fetch_feeds({"a": "url-a"}, parse_processes=1, download=download)["a"] == parse_feed(FEED)
+
+
+def test_process_pool_is_resized_on_request():
+    pool = get_process_pool(1)
+    assert get_process_pool(1) is pool
+    assert get_process_pool(2) is not pool
+
+
+def test_failed_refresh_keeps_serving_stale_articles(tmp_path, monkeypatch):
+    main = pytest.importorskip("main")
+    from articles import ArticleCache
+    from source_catalog import SourceCatalog
+
+    path = tmp_path / "news_sources.json"
+    path.write_text('{"sources": [{"name": "CDC", "url": "https://cdc.example/feed", "category": "Health"}]}')
+    catalog = SourceCatalog(str(path))
+    catalog.reload_if_changed()
+    cache = ArticleCache()
+    stale = [make_article("cached")]
+    cache.put("CDC", stale)
+
+    monkeypatch.setattr(main, "source_catalog", catalog)
+    monkeypatch.setattr(main, "article_cache", cache)
+    monkeypatch.setattr(main, "fetch_feeds", lambda feeds, *args, **kwargs: {name: IOError("down") for name in feeds})
+    # A zero refresh interval makes the cached copy stale, so a refresh is attempted and fails
+    monkeypatch.setattr(catalog.sources["CDC"], "refresh_interval", 0)
+    assert main.load_source_articles() == {"CDC": stale}
@@ -0,0 +1,101 @@
+"""
+Tests for the research result store
+"""
+import pytest
+
+from research_store import ResearchStore, topic_key
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResearchStore(str(tmp_path / "results.db"), compact_every=0)
+    yield store
+    store.close()
+
+
+def test_topic_key_normalizes_case_and_whitespace():
+    assert topic_key("  Quantum   Computing ") == topic_key("quantum computing")
+
+
+def test_latest_uses_normalized_topic(store):
+    store.save({"topic": "AI", "summary": "old"}, saved_at=100)
+    store.save({"topic": " ai ", "summary": "new"}, saved_at=200)
+    assert store.latest("Ai")["summary"] == "new"
+    assert store.latest("unknown") is None
+
+
+def test_latest_breaks_time_ties_by_insertion_order(store):
+    store.save({"topic": "AI", "summary": "first"}, saved_at=100)
+    store.save({"topic": "AI", "summary": "second"}, saved_at=100)
+    assert store.latest("AI")["summary"] == "second"
+
+
+def test_between_is_half_open_and_newest_first(store):
+    store.save_many([{"topic": "AI", "summary": "a"}, {"topic": "Bio", "summary": "b"}], saved_at=100)
+    store.save({"topic": "AI", "summary": "c"}, saved_at=200)
+    store.save({"topic": "AI", "summary": "d"}, saved_at=300)
+
+    assert [r["summary"] for r in store.between(100, 300)] == ["c", "b", "a"]
+    assert [r["summary"] for r in store.between(0, 1000, topic="ai")] == ["d", "c", "a"]
+    assert [r["summary"] for r in store.between(0, 1000, limit=1)] == ["d"]
+
+
+def test_compact_keeps_newest_per_topic(store):
+    for i in range(4):
+        store.save({"topic": "AI", "summary": str(i)}, saved_at=100 + i)
+    store.save({"topic": "Bio", "summary": "only"}, saved_at=50)
+
+    assert store.compact(keep_per_topic=2) == 2
+    assert [r["summary"] for r in store.between(0, 1000, topic="AI")] == ["3", "2"]
+    assert store.latest("Bio")["summary"] == "only"
+
+
+def test_compact_older_than_spares_recent_rows(store):
+    for i in range(4):
+        store.save({"topic": "AI", "summary": str(i)}, saved_at=100 + i)
+
+    # Only rows saved before 102 are eligible, so "2" survives despite keep_per_topic=1
+    assert store.compact(keep_per_topic=1, older_than=102) == 2
+    assert [r["summary"] for r in store.between(0, 1000)] == ["3", "2"]
+
+
+def test_automatic_compaction(tmp_path):
+    store = ResearchStore(str(tmp_path / "results.db"), keep_per_topic=1, compact_every=3)
+    for i in range(3):
+        store.save({"topic": "AI", "summary": str(i)}, saved_at=100 + i)
+    assert [r["summary"] for r in store.between(0, 1000)] == ["2"]
+    store.close()
+
+
+def test_retention_is_opt_in(tmp_path):
+    store = ResearchStore(str(tmp_path / "results.db"), keep_per_topic=1)
+    for i in range(10):
+        store.save({"topic": "AI", "summary": str(i)}, saved_at=100 + i)
+    assert len(store.between(0, 1000)) == 10
+    store.vacuum()
+    assert len(store.between(0, 1000)) == 10
+    store.close()
+
+
+@pytest.fixture
+def save_function(tmp_path, monkeypatch):
+    # tools builds its langchain tools on import, which needs the optional search packages
+    tools = pytest.importorskip("tools", exc_type=ImportError)
+    store = ResearchStore(str(tmp_path / "results.db"), keep_per_topic=1, compact_every=1)
+    monkeypatch.setattr(tools, "get_store", lambda: store)
+    yield tools.save_function, store
+    store.close()
+
+
+def test_save_tool_notes_survive_retention(save_function):
+    save, store = save_function
+    for i in range(3):
+        save(f"note {i}")
+    assert sorted(r["summary"] for r in store.between(0, float("inf"))) == ["note 0", "note 1", "note 2"]
+
+
+@pytest.mark.parametrize("payload", ['{"topic": null}', '{"topic": 3}', '{"topic": "  "}'])
+def test_save_tool_treats_invalid_topics_as_notes(save_function, payload):
+    save, store = save_function
+    assert save(payload).startswith("Saved: note-")
+    assert store.between(0, float("inf"))[0]["summary"] == payload
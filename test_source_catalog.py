@@ -0,0 +1,87 @@
+"""
+Tests for the hot-reloaded news source catalog
+"""
+import json
+import os
+
+import pytest
+
+from source_catalog import SourceCatalog, load_catalog
+
+
+def write_catalog(path, sources, mtime):
+    path.write_text(json.dumps({"sources": sources}))
+    # Explicit mtimes so reloads never depend on filesystem timestamp resolution
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "news_sources.json"
+    write_catalog(path, [
+        {"name": "Reuters", "url": "https://reuters.example/feed", "category": "General News"},
+        {"name": "Wired", "url": "https://wired.example/feed", "category": "Technology", "priority": 5},
+    ], mtime=1_000_000_000)
+    return path
+
+
+def test_initial_load_orders_by_priority_and_keeps_file_category_order(catalog_path):
+    catalog = SourceCatalog(str(catalog_path))
+    assert catalog.reload_if_changed() == {"Reuters", "Wired"}
+    assert list(catalog.sources) == ["Wired", "Reuters"]
+    assert catalog.categories == ["General News", "Technology"]
+    assert catalog.reload_if_changed() == set()
+
+
+def test_reload_reports_only_changed_sources(catalog_path):
+    catalog = SourceCatalog(str(catalog_path))
+    catalog.reload_if_changed()
+    write_catalog(catalog_path, [
+        {"name": "Reuters", "url": "https://reuters.example/feed", "category": "General News"},
+        {"name": "NPR", "url": "https://npr.example/feed"},
+    ], mtime=2_000_000_000)
+    assert catalog.reload_if_changed() == {"Wired", "NPR"}
+    assert set(catalog.sources) == {"Reuters", "NPR"}
+
+
+def test_bad_edit_keeps_last_good_catalog(catalog_path, capsys):
+    catalog = SourceCatalog(str(catalog_path))
+    catalog.reload_if_changed()
+    catalog_path.write_text("{not json")
+    os.utime(catalog_path, ns=(3_000_000_000, 3_000_000_000))
+    assert catalog.reload_if_changed() == set()
+    assert set(catalog.sources) == {"Reuters", "Wired"}
+    # Reported once, not on every lookup
+    assert catalog.reload_if_changed() == set()
+    assert capsys.readouterr().out.count("Error loading") == 1
+
+
+def test_duplicate_names_are_rejected(catalog_path):
+    write_catalog(catalog_path, [
+        {"name": "Reuters", "url": "https://a.example/feed"},
+        {"name": "Reuters", "url": "https://b.example/feed"},
+    ], mtime=4_000_000_000)
+    with pytest.raises(ValueError, match="Reuters"):
+        load_catalog(str(catalog_path))
+
+    catalog = SourceCatalog(str(catalog_path))
+    assert catalog.reload_if_changed() == set()
+    assert catalog.sources == {}
+
+
+def test_shipped_catalog_is_valid():
+    sources = load_catalog(os.path.join(os.path.dirname(__file__), "news_sources.json"))
+    assert len(sources) == len({source.name for source in sources})
+
+
+def test_settings_only_edit_keeps_cached_state(catalog_path):
+    catalog = SourceCatalog(str(catalog_path))
+    catalog.reload_if_changed()
+    write_catalog(catalog_path, [
+        {"name": "Reuters", "url": "https://reuters.example/feed", "category": "General News",
+         "priority": 9, "timeout": 3, "refresh_interval": 60},
+        {"name": "Wired", "url": "https://wired.example/feed", "category": "Science", "priority": 5},
+    ], mtime=5_000_000_000)
+    assert catalog.reload_if_changed() == {"Wired"}
+    assert catalog.sources["Reuters"].timeout == 3
+    assert list(catalog.sources) == ["Reuters", "Wired"]
@@ -1,5 +1,8 @@
+import json
+import time
 from langchain.tools import Tool
 from langchain_community.tools import DuckDuckGoSearchRun
+from research_store import get_store
 
 def search_function(query: str) -> str:
     # Placeholder search logic
@@ -10,8 +13,20 @@ def wiki_function(query: str) -> str:
     return f"Wiki summary for: {query}"
 
 def save_function(data: str) -> str:
-    # Simulate saving
-    return f"Saved: {data}"
+    # Persist a ResearchResponse JSON payload; anything else is kept as a note
+    try:
+        record = json.loads(data)
+    except ValueError:
+        record = None
+    if not isinstance(record, dict) or not isinstance(record.get("topic"), str) or not record["topic"].strip():
+        # Each note gets its own topic key so per-topic retention never drops one note for another
+        record = {"topic": f"note-{time.time_ns()}", "summary": data}
+    # Stored rows are read back as ResearchResponse, so fill in its required fields
+    record.setdefault("summary", "")
+    record.setdefault("sources", [])
+    record.setdefault("tools_used", [])
+    row_id = get_store().save(record)
+    return f"Saved: {record['topic']} (#{row_id})"
 
 search_tool = DuckDuckGoSearchRun()
 